@@ -0,0 +1,163 @@
+'''
+File : StarCatalog.py
+Author : agent
+Date Created : 10/19/2026
+
+Purpose : Reading external star catalogs of x, y positions and magnitudes for the star trail scripts. Binary catalogs are memory-mapped and CSV catalogs are parsed in bulk chunks, so millions of stars are never held as Python objects. Positions are projected into the w x h canvas and magnitudes mapped to the star size and alpha.
+
+Catalog Formats :
+	.npy		numpy array, (n, 3) of x, y, mag or structured with x, y, mag fields
+	.csv / .txt	comma separated x, y, mag columns, optional header line
+	.bin / .f32	raw float32 x, y, mag triplets
+
+Usage :
+	from StarCatalog import openCatalog, catalogRows, catalogBounds, projectCatalog
+
+	catalog, n_bytes = openCatalog(path, max_rows=n_stars)
+	bounds = catalogBounds(catalog)
+	x, y, size, alpha = projectCatalog(catalogRows(catalog, start, stop), bounds, w, h)
+
+'''
+
+#--- Importing Python Modules ---#
+
+import os
+import itertools
+import numpy as np
+
+#--- Parameters ---#
+
+# Rows read per bulk chunk :
+CATALOG_CHUNK = 65536
+
+#--- Reading Catalogs ---#
+
+def countLines(path, block_size=2**20):
+	'''
+	Function for counting the lines of a text file by reading it in binary blocks.
+	'''
+	n_lines = 0
+	last = b'\n'
+	with open(path, 'rb') as f:
+		for block in iter(lambda: f.read(block_size), b''):
+			n_lines += block.count(b'\n')
+			last = block[-1:]
+
+	# Last line without a trailing newline :
+	if last != b'\n' :
+		n_lines += 1
+	return n_lines ;
+
+def readCSV(path, chunk_rows=CATALOG_CHUNK, max_rows=None):
+	'''
+	Function for reading the x, y, mag columns of a CSV catalog into an (n, 3) array, parsing <chunk_rows> lines at a time and stopping after <max_rows> data rows (all with None). Returns the array and the bytes read.
+	'''
+	# Lines are only counted when the whole file is read :
+	if max_rows is None :
+		max_rows = countLines(path)
+	catalog = np.empty( (max_rows, 3) )
+
+	n_rows = 0
+	n_bytes = 0
+	with open(path, 'rb') as f:
+
+		# Skip a header line :
+		first = f.readline()
+		try:
+			float(first.split(b',')[0])
+			f.seek(0)
+		except ValueError:
+			n_bytes += len(first)
+
+		while n_rows < max_rows :
+
+			# Never more lines than the data rows still wanted :
+			lines = list(itertools.islice(f, min(chunk_rows, max_rows - n_rows)))
+			if not lines :
+				break
+			n_bytes += sum(len(line) for line in lines)
+
+			# Drop blank and comment lines, so loadtxt never gets a chunk without data :
+			lines = [line for line in lines if line.strip() and not line.lstrip().startswith(b'#')]
+			if not lines :
+				continue
+
+			rows = np.loadtxt(lines, delimiter=',', usecols=(0, 1, 2), ndmin=2)
+			catalog[n_rows:n_rows+len(rows)] = rows
+			n_rows += len(rows)
+
+	# Drop the rows counted for the header, blank and comment lines :
+	return catalog[:n_rows], n_bytes ;
+
+def openCatalog(path, chunk_rows=CATALOG_CHUNK, max_rows=None):
+	'''
+	Function for opening up to <max_rows> stars (all with None) of a star catalog as an array of x, y, mag rows, read with catalogRows. Binary catalogs are memory-mapped rather than read. Returns the catalog and the bytes read from it.
+	'''
+	ext = os.path.splitext(path)[1].lower()
+
+	if ext in ('.csv', '.txt') :
+		return readCSV(path, chunk_rows, max_rows)
+
+	if ext == '.npy' :
+		catalog = np.load(path, mmap_mode='r')
+
+	elif ext in ('.bin', '.f32') :
+		# Raw float32 triplets :
+		catalog = np.memmap(path, dtype=np.float32, mode='r')
+		if catalog.size % 3 :
+			raise ValueError('%s is not a raw catalog, raw catalogs must be float32 x, y, mag triplets' % (path,))
+		catalog = catalog.reshape(-1, 3)
+
+	else :
+		raise ValueError('unknown catalog format %s, expected .npy, .csv, .txt, .bin or .f32' % (path,))
+
+	# Memory-mapped rows used :
+	catalog = catalog[:max_rows]
+	return catalog, catalog.nbytes ;
+
+def catalogRows(catalog, start, stop):
+	'''
+	Function for reading catalog rows [start, stop) as an (n, 3) float array of x, y, mag, for both plain and structured catalogs.
+	'''
+	rows = catalog[start:stop]
+	if catalog.dtype.names is not None :
+		return np.column_stack( (rows['x'], rows['y'], rows['mag']) ).astype(float)
+	return np.asarray(rows[:,:3], dtype=float) ;
+
+#--- Projecting Catalogs ---#
+
+def catalogBounds(catalog, chunk_rows=CATALOG_CHUNK):
+	'''
+	Function for finding the (x_min, x_max, y_min, y_max, mag_min, mag_max) bounds of a catalog, one chunk at a time so memory-mapped catalogs are streamed.
+	'''
+	lo = np.full(3, np.inf)
+	hi = np.full(3, -np.inf)
+	for start in range(0, len(catalog), chunk_rows):
+		rows = catalogRows(catalog, start, start + chunk_rows)
+		lo = np.minimum(lo, rows.min(axis=0))
+		hi = np.maximum(hi, rows.max(axis=0))
+	return lo[0], hi[0], lo[1], hi[1], lo[2], hi[2] ;
+
+def projectCatalog(rows, bounds, w, h):
+	'''
+	Function for projecting catalogRows <rows> into the <w> x <h> canvas, keeping the catalog aspect ratio, and mapping magnitude to star size and alpha (brightest stars largest and most opaque). Returns x, y, size, alpha arrays.
+	'''
+	x_min, x_max, y_min, y_max, mag_min, mag_max = bounds
+
+	# Scale to fit the canvas and center :
+	dx = max(x_max - x_min, 1e-12)
+	dy = max(y_max - y_min, 1e-12)
+	scale = min(w / dx, h / dy)
+	x = (w - scale * dx) / 2 + scale * (rows[:,0] - x_min)
+	y = (h - scale * dy) / 2 + scale * (rows[:,1] - y_min)
+
+	# Brightness, 1 for the lowest magnitude and 0 for the highest :
+	brightness = (mag_max - rows[:,2]) / max(mag_max - mag_min, 1e-12)
+
+	# Random star size range, with a floor so the faintest stars are still drawn :
+	size = .05 + .95 * brightness
+
+	# Faintest stars half transparent :
+	alpha = .5 + .5 * brightness
+
+	return x, y, size, alpha ;
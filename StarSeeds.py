@@ -0,0 +1,91 @@
+'''
+File : StarSeeds.py
+Author : agent
+Date Created : 10/19/2026
+
+Purpose : Seeding for the star trail scripts. A single master <seed> (the --seed option) is hashed together with a stream name, such as ('position', star) or ('attributes', block), into an independent random stream. Streams only depend on the master seed and their name, never on the order they are created in, so positions, sizes, alphas and colors come out identical however the stars are split into chunks or workers.
+
+Usage :
+	from StarSeeds import seedOption, randomStream
+
+	seed = seedOption(sys.argv)
+	rng = randomStream(seed, 'position', i)
+
+'''
+
+#--- Importing Python Modules ---#
+
+import random
+import hashlib
+
+#--- Parameters ---#
+
+# Stars per numpy stream in blockChunks, fixed so block boundaries never move :
+STREAM_BLOCK = 4096
+
+#--- Options ---#
+
+def optionValue(argv, flag, default=None):
+	'''
+	Function for reading the value following <flag> in <argv>, i.e. --seed 42. Returns <default> when the flag is not given.
+	'''
+	if flag not in argv :
+		return default
+	i = argv.index(flag)
+	if i + 1 >= len(argv) :
+		raise ValueError('%s requires a value' % (flag,))
+	return argv[i+1] ;
+
+def seedOption(argv):
+	'''
+	Function for reading the master seed from the --seed option. Without it a new seed is drawn from the system and printed, so the run can still be reproduced.
+	'''
+	seed = optionValue(argv, '--seed')
+	if seed is None :
+		seed = random.SystemRandom().randint(0, 2**32 - 1)
+	else :
+		seed = int(seed)
+	print 'Seed : %d' % (seed,)
+	return seed ;
+
+#--- Streams ---#
+
+def streamSeed(seed, *key):
+	'''
+	Function for deriving the 128 bit seed of the stream named by <key> from the master <seed> (SeedSequence style spawning by hashing).
+	'''
+	name = '/'.join([str(seed)] + [str(k) for k in key])
+	return int(hashlib.sha256(name.encode('utf-8')).hexdigest()[:32], 16) ;
+
+def randomStream(seed, *key):
+	'''
+	Function for creating a random.Random stream named by <key>, i.e. randomStream(seed, 'position', i) for star i.
+	'''
+	return random.Random( streamSeed(seed, *key) ) ;
+
+def numpyStream(seed, *key):
+	'''
+	Function for creating a numpy RandomState stream named by <key>.
+	'''
+	import numpy as np
+
+	# RandomState seeds from 32 bit words :
+	s = streamSeed(seed, *key)
+	words = [ (s >> (32 * i)) & 0xffffffff for i in range(0,4) ]
+	return np.random.RandomState(words) ;
+
+def blockChunks(seed, key, start, stop, chunk_size, draw, block_size=STREAM_BLOCK):
+	'''
+	Generator for walking stars [start, stop) in chunks of at most <chunk_size>, yielding (start, stop, values). Star i always comes from the numpy stream (<key>, i // <block_size>): each block is drawn once with <draw>(rng, n) and handed out in slices, so a star gets the same values whatever chunk it is in. Chunks are cut at block boundaries, so chunk sizes that are not a multiple of <block_size> give extra, shorter chunks.
+	'''
+	for block in range(start // block_size, (stop - 1) // block_size + 1):
+		block_start = block * block_size
+		values = draw(numpyStream(seed, key, block), block_size)
+
+		# Part of this block inside [start, stop) :
+		lo = max(start, block_start)
+		hi = min(stop, block_start + block_size)
+
+		for chunk_start in range(lo, hi, chunk_size):
+			chunk_stop = min(chunk_start + chunk_size, hi)
+			yield chunk_start, chunk_stop, values[chunk_start - block_start:chunk_stop - block_start]
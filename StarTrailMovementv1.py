@@ -6,10 +6,15 @@ Date Created : 12/30/2017
 
 Purpose : A python script simulate star trails for a random array of positions for <n_stars> around a randomly positioned rotational axis. The stars are then rotated for a length of a <rotation_angle>. A image of each rotation iteration is rendered and then all iterations are combined into a GIF using Image Magick.
 
-Execution : ./StarTrailMovementv1.py <n_stars> <rotation_angle>
+Execution : ./StarTrailMovementv1.py <n_stars> <rotation_angle> [--headless] [--initial] [--seed <seed>]
 
 Example Execution : ./StarTrailMovementv1.py 200 30
 
+Options :
+	--headless	pin the Agg backend so no display is needed (batch jobs)
+	--initial	also render the Stars_Initial diagnostic figure
+	--seed		master seed, to reproduce a previous run (printed at start)
+
 '''
 
 #--- Start of Script ---#
@@ -17,11 +22,10 @@ Example Execution : ./StarTrailMovementv1.py 200 30
 #--- Importing Python Modules ---#
 
 import sys
-import random
-from matplotlib import pyplot as plt
 import time
 import math
 from colorsys import hsv_to_rgb
+from StarSeeds import seedOption, randomStream
 import os, errno
 
 #--- Initial Parameters ---#
@@ -53,6 +57,20 @@ delta_angle = delta_angle * pi / 180	# convert to radians
 # Steps of Rotation :
 n_rotations = int(rotation_angle / delta_angle)
 
+# Optional Flags :
+headless = '--headless' in sys.argv	# Agg backend, no display needed
+plot_initial = '--initial' in sys.argv	# Render Stars_Initial diagnostic figure
+
+def importPyplot():
+	'''
+	Function for lazily importing pyplot, only on the code paths that plot. The Agg backend is pinned first when running headless.
+	'''
+	if headless :
+		import matplotlib
+		matplotlib.use('Agg')
+	from matplotlib import pyplot as plt
+	return plt ;
+
 #--- Star Initial Positions ---#
 #print 'Star Initial Positions :'
 
@@ -63,9 +81,13 @@ star_y = [[] for _ in xrange(n_stars)]	# stars y position nested list
 star_initial_x =  []	# stars x position list
 star_initial_y =  []	# stars y position list
 
+# Master Seed :
+seed = seedOption(sys.argv)
+
 # Defining Random Rotational Axis :
-rotational_axis_x = random.uniform(0,w)
-rotational_axis_y = random.uniform(0,h)
+axis_rng = randomStream(seed, 'axis')
+rotational_axis_x = axis_rng.uniform(0,w)
+rotational_axis_y = axis_rng.uniform(0,h)
 
 # Find max radius from rotational axis to corners
 
@@ -90,31 +112,41 @@ r_max = r[-1]
 #print rotational_axis_x, rotational_axis_y, r
 
 # Randomly Defining Stars Position :
+# (each star has its own stream so chunking never changes its position)
 for i in range(0,n_stars):
-	star_initial_x.append( random.uniform( rotational_axis_x - r_max, rotational_axis_x + r_max) )
-	star_initial_y.append( random.uniform( rotational_axis_y - r_max , rotational_axis_y + r_max) )
+	rng = randomStream(seed, 'position', i)
+	star_initial_x.append( rng.uniform( rotational_axis_x - r_max, rotational_axis_x + r_max) )
+	star_initial_y.append( rng.uniform( rotational_axis_y - r_max , rotational_axis_y + r_max) )
+
+	# Startup time, tracked by StartupBenchmark.py :
+	if i == 0 :
+		print 'First star computed : %f secs' % (time.time() - t_start)
 
 	#print 'Star '+str(i+1)+' (star_x, star_y) = \t('+str(star_initial_x[i])+','+str(star_initial_y[i])+')'
 
 #--- Plot Initial Star and Rotational Positions ---#
 
-plt.figure(1)		# Initialize First Plot
+if plot_initial :
 
-# Legend Labes :
-star_label = 'n_stars = '+str(n_stars)
-rotation_label = 'Axis of Rotation, rotate = '+str(sys.argv[2])
+	plt = importPyplot()
 
-plt.plot(star_initial_x, star_initial_y, '*', label = star_label)	# Star Plot
-plt.plot(rotational_axis_x, rotational_axis_y, 'o',label = rotation_label)			# Rotation Axis Plot
+	plt.figure(1)		# Initialize First Plot
 
-plt.xlim([0,w])		# X Range
-plt.ylim([0,h])		# Y Range
+	# Legend Labes :
+	star_label = 'n_stars = '+str(n_stars)
+	rotation_label = 'Axis of Rotation, rotate = '+str(sys.argv[2])
+
+	plt.plot(star_initial_x, star_initial_y, '*', label = star_label)	# Star Plot
+	plt.plot(rotational_axis_x, rotational_axis_y, 'o',label = rotation_label)			# Rotation Axis Plot
 
-plt.legend(loc='upper left')
+	plt.xlim([0,w])		# X Range
+	plt.ylim([0,h])		# Y Range
 
-print "Rendering Initial Figure : Gif_Figures/Stars_Initial_"+date+".png"
+	plt.legend(loc='upper left')
 
-plt.savefig("Figures/Stars_Initial_"+date+".png")	# Save Plot
+	print "Rendering Initial Figure : Gif_Figures/Stars_Initial_"+date+".png"
+
+	plt.savefig("Figures/Stars_Initial_"+date+".png")	# Save Plot
 
 #--- Rotate Stars ---#
 
@@ -149,6 +181,8 @@ for i in range(1,n_rotations):
 #--- Star Characteristics ---#
 
 # Initialize Star Trail Plot :
+plt = importPyplot()
+
 star_trail = plt.figure(2, frameon=False)	
 
 plt.xlim([0,w])		# X Range
@@ -168,25 +202,28 @@ star_alpha = []
 print '\nAssigning Randomized Star Attributes...'
 for j in range(0,n_stars):
 
+	# Star Attribute Stream :
+	rng = randomStream(seed, 'attributes', j)
+
 	# Star Alpha (Transparency) :
 	# Beta Distribution Sampling 
 	# (0 - 1 skewed distribution towards 0):
-	star_alpha.append( 1 - random.betavariate(2,15) )
+	star_alpha.append( 1 - rng.betavariate(2,15) )
 
 	# Star Size :
-	star_size.append( random.betavariate(2,4) )	
+	star_size.append( rng.betavariate(2,4) )	
 
 	# Star Random Color Variation from White :
 	# White in HSV (0,0,1)
 	if ( j % 50 == 0 ) :	# Add Normal Colored Stars
-		h = random.uniform(0, 1) 	# Hue
-		s = random.uniform(0, 1)	# Saturation
-		v = random.uniform(0, 1)	# Value
+		h = rng.uniform(0, 1) 	# Hue
+		s = rng.uniform(0, 1)	# Saturation
+		v = rng.uniform(0, 1)	# Value
 
 	else :
-		h = random.uniform(0, 1) 		# Hue
-		s = random.betavariate(1, 15)		# Saturation
-		v = 1 -  random.betavariate(1, 15)	# Value
+		h = rng.uniform(0, 1) 		# Hue
+		s = rng.betavariate(1, 15)		# Saturation
+		v = 1 -  rng.betavariate(1, 15)	# Value
 
 	#print h, s, v
 
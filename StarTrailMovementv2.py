@@ -9,10 +9,17 @@ License :	MIT License
 
 Purpose : A python script simulate star trails for a random array of positions for <n_stars> around a randomly positioned rotational axis. The stars are then rotated for a length of a <rotation_angle>. A gif is created using the animation tools in matplotlib.
 
-Execution : ./StarTrailMovementv2.py <n_stars> <rotation_angle>
+Execution : ./StarTrailMovementv2.py <n_stars> <rotation_angle> [--headless] [--initial] [--seed <seed>] [--chunk <n_chunk>] [--catalog <path>]
 
 Example Execution : ./StarTrailMovementv2.py 200 30
 
+Options :
+	--headless	pin the Agg backend so no display is needed (batch jobs)
+	--initial	also render the Stars_Initial diagnostic figure
+	--seed		master seed, to reproduce a previous run (printed at start)
+	--chunk		stars generated per chunk, does not change the stars drawn (chunks are cut at 4096 star blocks, so sizes that are not a multiple of 4096 give extra, shorter chunks)
+	--catalog	read star positions and magnitudes from a catalog (.npy, .csv, .txt, or raw float32 .bin / .f32, see StarCatalog.py), up to <n_stars> stars or all with 0
+
 Animation based on : rain.py by Nicolas P. Rougier (https://matplotlib.org/examples/animation/rain.html)
 
 '''
@@ -27,10 +34,8 @@ import numpy as np
 import math
 import time
 import os, errno
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
-from matplotlib import animation
-from matplotlib.colors import hsv_to_rgb
+from StarSeeds import optionValue, seedOption, numpyStream, blockChunks
+from StarCatalog import openCatalog, catalogRows, catalogBounds, projectCatalog
 
 #--- Initial Parameters ---#
 
@@ -61,6 +66,39 @@ delta_angle = delta_angle * pi / 180	# convert to radians
 # Steps of Rotation :
 n_rotations = int(rotation_angle / delta_angle)
 
+# Optional Flags :
+headless = '--headless' in sys.argv	# Agg backend, no display needed
+plot_initial = '--initial' in sys.argv	# Render Stars_Initial diagnostic figure
+
+def importPyplot():
+	'''
+	Function for lazily importing pyplot, only on the code paths that plot. The Agg backend is pinned first when running headless.
+	'''
+	if headless :
+		import matplotlib
+		matplotlib.use('Agg')
+	import matplotlib.pyplot as plt
+	return plt ;
+
+# Star Catalog :
+catalog_path = optionValue(sys.argv, '--catalog')
+
+if catalog_path is not None :
+
+	t_load_start = time.time()
+
+	# Memory-mapped or bulk read, not Python objects :
+	# Up to <n_stars> catalog stars, all with 0 :
+	catalog, catalog_bytes = openCatalog(catalog_path, max_rows = n_stars if n_stars > 0 else None)
+	n_stars = len(catalog)
+
+	catalog_bounds = catalogBounds(catalog)
+
+# Stars Generated per Chunk :
+chunk_size = int(optionValue(sys.argv, '--chunk', max(n_stars, 1)))
+if chunk_size < 1 :
+	raise ValueError('--chunk must be at least 1, got %d' % (chunk_size,))
+
 #--- Star Initial Positions ---#
 
 # Initialize Star Data Arrays :
@@ -72,11 +110,15 @@ stars = np.zeros(n_stars, dtype=[('position', float, 2),
 	('alpha',    	float, 1),
 	('color',    	float, 3)])
 
-#hsv = np.zeros( (n_stars,3))
+hsv = np.zeros( (n_stars,3))
+
+# Master Seed :
+seed = seedOption(sys.argv)
 
 # Rotational Axis :
-rotational_axis_x = np.random.uniform(0, w)
-rotational_axis_y = np.random.uniform(0, h)
+axis_rng = numpyStream(seed, 'axis')
+rotational_axis_x = axis_rng.uniform(0, w)
+rotational_axis_y = axis_rng.uniform(0, h)
 
 #print rotational_axis_x, rotational_axis_y
 
@@ -100,9 +142,43 @@ r.sort()
 
 r_max = r[-1]
 
-# Stars Random Positions :
-stars['position'][:,0] = np.random.uniform(rotational_axis_x - r_max, rotational_axis_x + r_max, n_stars)
-stars['position'][:,1] = np.random.uniform(rotational_axis_y - r_max, rotational_axis_y + r_max, n_stars)
+# Stars Random or Catalog Positions :
+# (drawn from fixed blocks of stars, so the chunk size never changes a star)
+def drawPositions(rng, n):
+	'''
+	Function for drawing unit (x, y) positions of <n> stars, one star per row.
+	'''
+	return rng.uniform(0, 1, (n, 2)) ;
+
+if catalog_path is not None :
+	position_chunks = ( (start, min(start + chunk_size, n_stars), None) for start in range(0, n_stars, chunk_size) )
+else :
+	position_chunks = blockChunks(seed, 'position', 0, n_stars, chunk_size, drawPositions)
+
+for start, stop, unit in position_chunks:
+
+	if catalog_path is not None :
+		# Project into the w x h canvas, magnitudes set size and alpha :
+		x, y, size, alpha = projectCatalog(catalogRows(catalog, start, stop), catalog_bounds, w, h)
+		stars['position'][start:stop,0] = x
+		stars['position'][start:stop,1] = y
+		stars['size'][start:stop] = size
+		stars['alpha'][start:stop] = alpha
+
+	else :
+		stars['position'][start:stop,0] = rotational_axis_x - r_max + 2 * r_max * unit[:,0]
+		stars['position'][start:stop,1] = rotational_axis_y - r_max + 2 * r_max * unit[:,1]
+
+	# Startup time, tracked by StartupBenchmark.py (star 0 is in the first chunk) :
+	if start == 0 :
+		print 'First star computed : %f secs' % (time.time() - t_start)
+
+# Catalog Load Throughput :
+if catalog_path is not None :
+	t_load = max(time.time() - t_load_start, 1e-9)
+	# Bytes read from the catalog :
+	load_mb = catalog_bytes / 1e6
+	print 'Loaded Catalog : {:s} \t {:d} stars, {:.1f} MB in {:f} secs ( {:.0f} stars/sec, {:.1f} MB/sec )'.format(catalog_path, n_stars, load_mb, t_load, n_stars / t_load, load_mb / t_load)
 
 # Initial Configuration from Rotational Axis :
 stars['component'][:,0] = stars['position'][:,0] - rotational_axis_x
@@ -114,21 +190,36 @@ stars['angle'] = np.arctan( stars['component'][:,0] / stars['component'][:,1])
 
 #--- Star Characteristics ---#
 
-# Star Alpha (Transparency) :
-# Beta Distribution Sampling 
-# (0 - 1 skewed distribution towards 0):
-stars['alpha'] = 1 - np.random.beta(2,15) 
+def drawAttributes(rng, n):
+	'''
+	Function for drawing the alpha, size and HSV color of <n> stars, one star per row.
+	'''
+	# Star Alpha (Transparency) :
+	# Beta Distribution Sampling 
+	# (0 - 1 skewed distribution towards 0):
+	alpha = 1 - rng.beta(2, 15, n)
+
+	# Star Size :
+	size = rng.beta(2, 4, n)
 
-# Star Size :
-stars['size'] = np.random.beta(2,4)	
+	# Star Random Color Variation from White :
+	# White in HSV (0,0,1)
 
-# Star Random Color Variation from White :
-# White in HSV (0,0,1)
+	# Add Normal Colored Stars
+	hsv = rng.uniform(0, 1, (n, 3) ) 	# Hue
 
-# Add Normal Colored Stars
-hsv = np.random.uniform(0, 1, (n_stars, 3) ) 	# Hue
+	return np.column_stack( (alpha, size, hsv) ) ;
+
+for start, stop, attributes in blockChunks(seed, 'attributes', 0, n_stars, chunk_size, drawAttributes):
+	hsv[start:stop] = attributes[:,2:5]
+
+	# Catalog stars keep their magnitude size and alpha :
+	if catalog_path is None :
+		stars['alpha'][start:stop] = attributes[:,0]
+		stars['size'][start:stop] = attributes[:,1]
 
 # Convert HSV to RGB
+from matplotlib.colors import hsv_to_rgb
 stars['color'] = hsv_to_rgb( hsv )
 
 #h = np.random.uniform(0, 1) 		# Hue
@@ -137,31 +228,38 @@ stars['color'] = hsv_to_rgb( hsv )
 
 #--- Plot Initial Star and Rotational Positions ---#
 
-stars_initial = plt.figure(1)		# Initialize First Plot
+if plot_initial :
 
-# Legend Labes :
-star_label = 'n_stars = '+str(n_stars)
-rotation_label = 'Axis of Rotation, rotate = '+str(sys.argv[2])
+	plt = importPyplot()
 
-# Scatter Plots :
-plt.scatter( stars['position'][:, 0], stars['position'][:, 1], marker='*', label = star_label)	# Star Plot
-plt.scatter(rotational_axis_x, rotational_axis_y, marker='o', label = rotation_label)			# Rotation Axis Plot
+	stars_initial = plt.figure(1)		# Initialize First Plot
 
-# Plot Limits :
-plt.xlim([0, w])		# X Range
-plt.ylim([0, h])		# Y Range
+	# Legend Labes :
+	star_label = 'n_stars = '+str(n_stars)
+	rotation_label = 'Axis of Rotation, rotate = '+str(sys.argv[2])
+
+	# Scatter Plots :
+	plt.scatter( stars['position'][:, 0], stars['position'][:, 1], marker='*', label = star_label)	# Star Plot
+	plt.scatter(rotational_axis_x, rotational_axis_y, marker='o', label = rotation_label)			# Rotation Axis Plot
+
+	# Plot Limits :
+	plt.xlim([0, w])		# X Range
+	plt.ylim([0, h])		# Y Range
 
-# Legend :
-plt.legend(loc='upper left')
+	# Legend :
+	plt.legend(loc='upper left')
 
-print "Rendering Initial Figure : Figures/Stars_Initial_"+date+".png"
+	print "Rendering Initial Figure : Figures/Stars_Initial_"+date+".png"
 
-# Save Plot :
-plt.savefig("Figures/Stars_Initial_"+date+".png")
+	# Save Plot :
+	plt.savefig("Figures/Stars_Initial_"+date+".png")
 
 #--- Star Rotation Scatter plot ---#
 # Updated during animation as the stars rotate
 
+plt = importPyplot()
+from matplotlib import animation
+
 star_trails = plt.figure(2)
 
 # Plot Limits :
@@ -189,7 +287,13 @@ except OSError as e:
 	if e.errno != errno.EEXIST:
 		raise
 
-star_scat = ax.scatter(stars['position'][:, 0], stars['position'][:, 1], s=stars['size'], lw=0.5, edgecolors = stars['color'], facecolors = stars['color'])
+# Catalog Stars Drawn with their Magnitude Alpha :
+if catalog_path is not None :
+	star_rgba = np.column_stack( (stars['color'], stars['alpha']) )
+else :
+	star_rgba = stars['color']
+
+star_scat = ax.scatter(stars['position'][:, 0], stars['position'][:, 1], s=stars['size'], lw=0.5, edgecolors = star_rgba, facecolors = star_rgba)
 
 #--- Update Star Trail Rotation Function ---#
 def update_star_trail(i_rotation):
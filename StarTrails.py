@@ -6,10 +6,16 @@ Date Created : 11/24/2017
 
 Purpose : A python script simulate star trails for a random array of positions for <n_stars> around a randomly positioned rotational axis. The stars are then rotated for a length of a <rotation_angle>. A image is rendered from the star trails full rotation.
 
-Execution : StarTrails.py <n_stars> <rotation_angle>
+Execution : StarTrails.py <n_stars> <rotation_angle> [--headless] [--initial] [--seed <seed>] [--progressive]
 
 Example Execution : ./StarTrails.py 20 30
 
+Options :
+	--headless	pin the Agg backend so no display is needed (batch jobs)
+	--initial	also render the Stars_Initial diagnostic figure
+	--seed		master seed, to reproduce a previous run (printed at start)
+	--progressive	write a low dpi preview first, then refine through a dpi pyramid up to the final render
+
 '''
 
 #--- Start of Script ---#
@@ -18,11 +24,10 @@ Example Execution : ./StarTrails.py 20 30
 #--- Importing Python Modules ---#
 
 import sys
-import random
-from matplotlib import pyplot as plt
 import time
 import math
 from colorsys import hsv_to_rgb
+from StarSeeds import seedOption, randomStream
 
 #--- Initial Parameters ---#
 
@@ -53,6 +58,25 @@ delta_angle =  delta_angle * pi / 180	# Convert to radians
 # Steps of Rotation :
 n_rotations = int( rotation_angle / delta_angle )
 
+# Optional Flags :
+headless = '--headless' in sys.argv	# Agg backend, no display needed
+plot_initial = '--initial' in sys.argv	# Render Stars_Initial diagnostic figure
+progressive = '--progressive' in sys.argv	# Render preview and dpi pyramid before final figure
+
+# Render Resolution :
+dpi = 2000		# final figure
+preview_dpi = 60	# lowest pyramid level for --progressive
+
+def importPyplot():
+	'''
+	Function for lazily importing pyplot, only on the code paths that plot. The Agg backend is pinned first when running headless.
+	'''
+	if headless :
+		import matplotlib
+		matplotlib.use('Agg')
+	from matplotlib import pyplot as plt
+	return plt ;
+
 #--- Star Initial Positions ---#
 #print 'Star Initial Positions :'
 
@@ -63,9 +87,13 @@ star_y = [[] for _ in xrange(n_stars)]	# stars y position nested list
 star_initial_x =  []	# stars x position list
 star_initial_y =  []	# stars y position list
 
+# Master Seed :
+seed = seedOption(sys.argv)
+
 # Defining Random Rotational Axis :
-rotational_axis_x = random.uniform(0,w)
-rotational_axis_y = random.uniform(0,h)
+axis_rng = randomStream(seed, 'axis')
+rotational_axis_x = axis_rng.uniform(0,w)
+rotational_axis_y = axis_rng.uniform(0,h)
 
 # Find max radius from rotational axis to corners
 
@@ -90,31 +118,41 @@ r_max = r[-1]
 #print rotational_axis_x, rotational_axis_y, r
 
 # Randomly Defining Stars Position :
+# (each star has its own stream so chunking never changes its position)
 for i in range(0,n_stars):
-	star_initial_x.append( random.uniform( rotational_axis_x - r_max, rotational_axis_x + r_max) )
-	star_initial_y.append( random.uniform( rotational_axis_y - r_max , rotational_axis_y + r_max) )
+	rng = randomStream(seed, 'position', i)
+	star_initial_x.append( rng.uniform( rotational_axis_x - r_max, rotational_axis_x + r_max) )
+	star_initial_y.append( rng.uniform( rotational_axis_y - r_max , rotational_axis_y + r_max) )
+
+	# Startup time, tracked by StartupBenchmark.py :
+	if i == 0 :
+		print 'First star computed : %f secs' % (time.time() - t_start)
 
 	#print 'Star '+str(i+1)+' (star_x, star_y) = \t('+str(star_initial_x[i])+','+str(star_initial_y[i])+')'
 
 #--- Plot Initial Star and Rotational Positions ---#
 
-plt.figure(1)		# Initialize First Plot
+if plot_initial :
 
-# Legend Labes :
-star_label = 'n_stars = '+str(n_stars)
-rotation_label = 'Axis of Rotation, rotate = '+str(sys.argv[2])
+	plt = importPyplot()
 
-plt.plot(star_initial_x, star_initial_y, '*', label = star_label)	# Star Plot
-plt.plot(rotational_axis_x, rotational_axis_y, 'o',label = rotation_label)			# Rotation Axis Plot
+	plt.figure(1)		# Initialize First Plot
 
-plt.xlim([0,w])		# X Range
-plt.ylim([0,h])		# Y Range
+	# Legend Labes :
+	star_label = 'n_stars = '+str(n_stars)
+	rotation_label = 'Axis of Rotation, rotate = '+str(sys.argv[2])
 
-plt.legend(loc='upper left')
+	plt.plot(star_initial_x, star_initial_y, '*', label = star_label)	# Star Plot
+	plt.plot(rotational_axis_x, rotational_axis_y, 'o',label = rotation_label)			# Rotation Axis Plot
 
-print "Rendering Initial Figure : Figures/Stars_Initial_"+date+".png"
+	plt.xlim([0,w])		# X Range
+	plt.ylim([0,h])		# Y Range
 
-plt.savefig("Figures/Stars_Initial_"+date+".png")	# Save Plot
+	plt.legend(loc='upper left')
+
+	print "Rendering Initial Figure : Figures/Stars_Initial_"+date+".png"
+
+	plt.savefig("Figures/Stars_Initial_"+date+".png")	# Save Plot
 
 #--- Rotate Stars ---#
 
@@ -134,6 +172,8 @@ for i in range(0,n_stars):
 	#print 'Star '+str(i+1)+' (delta_x, delta_y) = \t('+str(delta_x)+', '+str(delta_y)+')'
 
 # Initialize Plot :
+plt = importPyplot()
+
 star_trail = plt.figure(2, frameon=False)
 
 plt.xlim([0,w])		# X Range
@@ -153,31 +193,34 @@ for j in range(0,n_stars):
 
 	print 'Rendering Trail for Star {0}\r'.format(j+1),
 
+	# Star Attribute Stream :
+	rng = randomStream(seed, 'attributes', j)
+
 	# Star Random Size and Alpha :
 
 	# Uniform Distribution Sampling :
-	#star_size.append(float(random.uniform(.001,1)))
-	#star_alpha.append(float(random.uniform(.5,1)))
+	#star_size.append(float(rng.uniform(.001,1)))
+	#star_alpha.append(float(rng.uniform(.5,1)))
 
 	# Gaussian Distribution Sampling :
-	#star_size.append(float(random.gauss(.01,.1) ) )
-	star_alpha.append(float(random.gauss(.9,.01) ) )
+	#star_size.append(float(rng.gauss(.01,.1) ) )
+	star_alpha.append(float(rng.gauss(.9,.01) ) )
 
 	# Beta Distribution Sampling 
 	# (0 - 1 skewed distribution towards 0):
-	star_size.append( random.betavariate(2,4) )	
+	star_size.append( rng.betavariate(2,4) )	
 
 	# Star Random Color Variation from White :
 	# White in HSV (0,0,1)
 	if ( j % 50 == 0 ) :
-		h = random.uniform(0, 1) 	# Hue
-		s = random.uniform(0, 1)	# Saturation
-		v = random.uniform(0, 1)	# Value
+		h = rng.uniform(0, 1) 	# Hue
+		s = rng.uniform(0, 1)	# Saturation
+		v = rng.uniform(0, 1)	# Value
 
 	else :
-		h = random.uniform(0, 1) 		# Hue
-		s = random.betavariate(1, 15)		# Saturation
-		v = 1 -  random.betavariate(1, 15)	# Value
+		h = rng.uniform(0, 1) 		# Hue
+		s = rng.betavariate(1, 15)		# Saturation
+		v = 1 -  rng.betavariate(1, 15)	# Value
 
 	# Give Every # Stars better Color :
 
@@ -200,8 +243,8 @@ for j in range(0,n_stars):
 
 #--- Plot ---#
 
-# Save Star Trail Plot :
-print "\nRendering Star Trail Figure : Figures/Star_Trails_"+date+".png"
+# End the trail progress line :
+print
 
 # Remove Frame and Axes :
 ax = star_trail.gca()
@@ -211,8 +254,43 @@ ax.set_xticks([])
 ax.set_yticks([])
 plt.axis('off')
 
+# Progressive Preview and Resolution Pyramid :
+# The trails are drawn once and each level only re-rasterizes them.
+# The tight bounding box is found by the preview and reused by every level.
+if progressive :
+
+	# Halve the final dpi down to the preview level (2000 -> 1000, ..., 62) :
+	pyramid_dpi = []
+	level_dpi = dpi // 2
+	while level_dpi >= preview_dpi :
+		pyramid_dpi.insert(0, level_dpi)
+		level_dpi = level_dpi // 2
+
+	# Measured by the preview save, which applies the equal aspect :
+	bbox = 'tight'
+
+	for level_dpi in pyramid_dpi :
+
+		# Thumbnail Title :
+		out_thumb = "Figures/Star_Trails_%s_dpi%04d.png" % (date, level_dpi)
+
+		star_trail.savefig(out_thumb, dpi=level_dpi, facecolor = background_color, bbox_inches=bbox, pad_inches=0)
+
+		print 'Rendering Pyramid Level dpi={:d} : {:s} \t ( {:f} secs )'.format(level_dpi, out_thumb, time.time() - t_start)
+
+		# Reuse the preview's tight bounding box for the later levels :
+		get_renderer = getattr(star_trail.canvas, 'get_renderer', None)
+		if level_dpi == pyramid_dpi[0] and get_renderer is not None :
+			bbox = star_trail.get_tightbbox( get_renderer() )
+
+else :
+	bbox = 'tight'
+
+# Save Star Trail Plot :
+print "Rendering Star Trail Figure : Figures/Star_Trails_"+date+".png"
+
 # High Quality:
-star_trail.savefig("Figures/Star_Trails_"+date+".png", dpi=2000, facecolor = background_color, bbox_inches='tight', pad_inches=0)
+star_trail.savefig("Figures/Star_Trails_"+date+".png", dpi=dpi, facecolor = background_color, bbox_inches=bbox, pad_inches=0)
 
 # Fast, Low Quality :
 #star_trail.savefig("Star_Trails_"+date+".png", facecolor='#152033', bbox_inches='tight', pad_inches=0)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+'''
+File : StartupBenchmark.py
+Author : Greg Furlich
+Date Created : 10/19/2026
+
+Purpose : A python script to benchmark the startup time of the star trail scripts, measured from interpreter start to the first star computed. Each run launches a fresh interpreter on <script> in headless mode and stops it as soon as it reports the first star, so the long render is never waited on. The scripts report the first star once it is placed, in StarTrailMovementv2.py with the first chunk of stars (and, with --catalog, after the catalog is opened and its bounds found).
+
+Execution : ./StartupBenchmark.py <script> [n_runs] [n_stars] [rotation_angle]
+
+Example Execution : ./StartupBenchmark.py StarTrails.py 10 20 30
+
+'''
+
+#--- Start of Script ---#
+
+#--- Importing Python Modules ---#
+
+import sys
+import time
+import subprocess
+
+#--- Initial Parameters ---#
+
+# Script to Benchmark :
+script = sys.argv[1]
+
+# Number of Runs :
+n_runs = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+if n_runs < 1 :
+	raise ValueError('n_runs must be at least 1, got %d' % (n_runs,))
+
+# Script Arguments :
+n_stars = sys.argv[3] if len(sys.argv) > 3 else '20'
+rotation_angle = sys.argv[4] if len(sys.argv) > 4 else '30'
+
+# Line printed by the scripts once the first star is computed :
+marker = 'First star computed'
+
+#--- Benchmark Startup ---#
+
+def startupTime(script, args):
+	'''
+	Function for timing a single run of <script> from interpreter start to the first star computed. Returns the wall time and the time reported by the script itself (from its own t_start, i.e. after interpreter startup).
+	'''
+	t_launch = time.time()
+
+	# Unbuffered so the marker line is seen as soon as it is printed :
+	proc = subprocess.Popen([sys.executable, '-u', script] + args, stdout=subprocess.PIPE)
+
+	t_wall = None
+	t_script = None
+
+	for line in iter(proc.stdout.readline, b''):
+		line = line.decode()
+		if line.startswith(marker):
+			t_wall = time.time() - t_launch
+			t_script = float(line.split(':')[1].split()[0])
+			break
+
+	# Skip the render, only startup is measured :
+	if proc.poll() is None:
+		proc.kill()
+	proc.wait()
+
+	if t_wall is None:
+		raise RuntimeError('%s exited before computing the first star' % (script,))
+
+	return t_wall, t_script ;
+
+print 'Benchmarking Startup : %s %s %s --headless (%i runs)' % (script, n_stars, rotation_angle, n_runs)
+
+t_walls = []
+t_scripts = []
+
+for i in range(0,n_runs):
+	t_wall, t_script = startupTime(script, [n_stars, rotation_angle, '--headless'])
+	t_walls.append(t_wall)
+	t_scripts.append(t_script)
+	print 'Run {:03d} / {:d} \t interpreter start to first star : {:f} secs \t ( in script : {:f} secs )'.format(i+1, n_runs, t_wall, t_script)
+
+#--- Summary ---#
+
+t_walls.sort()
+
+# Median, averaging the two middle runs for an even number of runs :
+mid = len(t_walls) // 2
+if len(t_walls) % 2 == 0 :
+	t_median = (t_walls[mid-1] + t_walls[mid]) / 2
+else :
+	t_median = t_walls[mid]
+
+print 'min : %f secs \t median : %f secs \t mean : %f secs' % (t_walls[0], t_median, sum(t_walls)/len(t_walls))
+
+#--- End of Script ---#